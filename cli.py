@@ -3,61 +3,31 @@ TaskTracker CLI Module
 Command-line interface for the TaskTracker application.
 """
 
+import argparse
 import sys
 from datetime import datetime
-from typing import List
+from typing import ClassVar, Dict, List
 from models import TaskStatus, Priority
 from services import TaskTrackerService
 
-
-class TaskTrackerCLI:
-    """Command-line interface for TaskTracker."""
-
-    def __init__(self):
-        """Initialize CLI with service instance."""
-        self.service = TaskTrackerService()
-        self.commands = {
-            # User commands
-            "add-user": self.add_user,
-            "list-users": self.list_users,
-            "update-user": self.update_user,
-            "delete-user": self.delete_user,
-            # Task commands
-            "add-task": self.add_task,
-            "list-tasks": self.list_tasks,
-            "update-task": self.update_task,
-            "delete-task": self.delete_task,
-            # Assignment commands
-            "assign-task": self.assign_task,
-            "unassign-task": self.unassign_task,
-            "reassign-task": self.reassign_task,
-            # View commands
-            "view-by-user": self.view_tasks_by_user,
-            "view-by-status": self.view_tasks_by_status,
-            "view-by-priority": self.view_tasks_by_priority,
-            "view-overdue": self.view_overdue_tasks,
-            # Utility commands
-            "search": self.search_tasks,
-            "stats": self.show_statistics,
-            "help": self.show_help,
-        }
-
-    def run(self, args: List[str]) -> None:
-        """Run the CLI with given arguments."""
-        if not args or args[0] not in self.commands:
-            self.show_help()
-            return
-
-        command = args[0]
-        try:
-            self.commands[command](args[1:])
-        except Exception as e:
-            print(f"Error: {str(e)}")
-            sys.exit(1)
-
-    def show_help(self, args: List[str] = None) -> None:
-        """Show help information."""
-        help_text = """
+# Command-line keywords, keyed by their lowercased spelling
+_STATUS_MAP = {
+    "todo": TaskStatus.TODO,
+    "progress": TaskStatus.IN_PROGRESS,
+    "done": TaskStatus.DONE,
+}
+_PRIORITY_MAP = {
+    "low": Priority.LOW,
+    "medium": Priority.MEDIUM,
+    "high": Priority.HIGH,
+    "urgent": Priority.URGENT,
+}
+
+# Display strings for enum members, used when rendering task tables
+_STATUS_STR = {s: s.value for s in TaskStatus}
+_PRIORITY_STR = {p: p.value for p in Priority}
+
+_HELP_TEXT = """
 TaskTracker - Task Management System
 
 USAGE:
@@ -96,332 +66,333 @@ EXAMPLES:
     python main.py add-task "Fix bug" --desc "Fix login issue" --priority high --due 2024-12-31
     python main.py assign-task task123 user456
     python main.py view-by-status todo
-        """
-        print(help_text)
 
-    # User Management Commands
-    def add_user(self, args: List[str]) -> None:
-        """Add a new user."""
-        if len(args) < 2:
-            print("Usage: add-user <name> <email> [role]")
+"""
+
+
+def _parse_priority(value: str) -> Priority:
+    """Convert a command-line string to a Priority."""
+    priority = _PRIORITY_MAP.get(value.lower())
+    if priority is None:
+        raise argparse.ArgumentTypeError(
+            "Invalid priority. Use: low, medium, high, urgent"
+        )
+    return priority
+
+
+def _parse_status(value: str) -> TaskStatus:
+    """Convert a command-line string to a TaskStatus."""
+    status = _STATUS_MAP.get(value.lower())
+    if status is None:
+        raise argparse.ArgumentTypeError("Invalid status. Use: todo, progress, done")
+    return status
+
+
+def _parse_date(value: str) -> datetime:
+    """Convert a YYYY-MM-DD string to a datetime."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError("Invalid date format. Use: YYYY-MM-DD")
+
+
+def _parse_user_ids(value: str) -> List[str]:
+    """Split a comma-separated list of user IDs."""
+    return value.split(",")
+
+
+_PARSER = argparse.ArgumentParser(prog="main.py", add_help=False)
+_SUBPARSERS = _PARSER.add_subparsers(dest="command", metavar="<command>")
+
+# User commands
+_p = _SUBPARSERS.add_parser("add-user")
+_p.add_argument("name")
+_p.add_argument("email")
+_p.add_argument("role", nargs="?", default="User")
+
+_SUBPARSERS.add_parser("list-users")
+
+_p = _SUBPARSERS.add_parser("update-user")
+_p.add_argument("user_id")
+_p.add_argument("--name")
+_p.add_argument("--email")
+_p.add_argument("--role")
+
+_p = _SUBPARSERS.add_parser("delete-user")
+_p.add_argument("user_id")
+
+# Task commands
+_p = _SUBPARSERS.add_parser("add-task")
+_p.add_argument("title")
+_p.add_argument("--desc", default="")
+_p.add_argument("--priority", type=_parse_priority, default=Priority.MEDIUM)
+_p.add_argument("--due", type=_parse_date)
+
+_SUBPARSERS.add_parser("list-tasks")
+
+_p = _SUBPARSERS.add_parser("update-task")
+_p.add_argument("task_id")
+_p.add_argument("--title")
+_p.add_argument("--desc")
+_p.add_argument("--status", type=_parse_status)
+_p.add_argument("--priority", type=_parse_priority)
+_p.add_argument("--due", type=_parse_date)
+
+_p = _SUBPARSERS.add_parser("delete-task")
+_p.add_argument("task_id")
+
+# Assignment commands
+_p = _SUBPARSERS.add_parser("assign-task")
+_p.add_argument("task_id")
+_p.add_argument("user_id")
+
+_p = _SUBPARSERS.add_parser("unassign-task")
+_p.add_argument("task_id")
+_p.add_argument("user_id")
+
+_p = _SUBPARSERS.add_parser("reassign-task")
+_p.add_argument("task_id")
+_p.add_argument("user_ids", type=_parse_user_ids)
+
+# View commands
+_p = _SUBPARSERS.add_parser("view-by-user")
+_p.add_argument("user_id")
+
+_p = _SUBPARSERS.add_parser("view-by-status")
+_p.add_argument("status", type=_parse_status)
+
+_p = _SUBPARSERS.add_parser("view-by-priority")
+_p.add_argument("priority", type=_parse_priority)
+
+_SUBPARSERS.add_parser("view-overdue")
+
+# Utility commands
+# Every word after "search" is query text, including ones starting with "-";
+# NUL never occurs in argv, so no word is ever taken for an option
+_p = _SUBPARSERS.add_parser("search", prefix_chars="\0", add_help=False)
+_p.add_argument("query", nargs=argparse.REMAINDER)
+
+_SUBPARSERS.add_parser("stats")
+
+_SUBPARSERS.add_parser("help")
+
+del _p
+
+
+class TaskTrackerCLI:
+    """Command-line interface for TaskTracker."""
+
+    # Command name -> handler method name
+    _COMMANDS: ClassVar[Dict[str, str]] = {
+        # User commands
+        "add-user": "add_user",
+        "list-users": "list_users",
+        "update-user": "update_user",
+        "delete-user": "delete_user",
+        # Task commands
+        "add-task": "add_task",
+        "list-tasks": "list_tasks",
+        "update-task": "update_task",
+        "delete-task": "delete_task",
+        # Assignment commands
+        "assign-task": "assign_task",
+        "unassign-task": "unassign_task",
+        "reassign-task": "reassign_task",
+        # View commands
+        "view-by-user": "view_tasks_by_user",
+        "view-by-status": "view_tasks_by_status",
+        "view-by-priority": "view_tasks_by_priority",
+        "view-overdue": "view_overdue_tasks",
+        # Utility commands
+        "search": "search_tasks",
+        "stats": "show_statistics",
+        "help": "show_help",
+    }
+
+    def __init__(self):
+        """Initialize CLI with service instance."""
+        self.service = TaskTrackerService()
+
+    def run(self, args: List[str]) -> None:
+        """Run the CLI with given arguments."""
+        name = self._COMMANDS.get(args[0]) if args else None
+        if name is None:
+            self.show_help()
             return
 
-        name = args[0]
-        email = args[1]
-        role = args[2] if len(args) > 2 else "User"
+        parsed = _PARSER.parse_args(args)
+        try:
+            getattr(self, name)(parsed)
+        except Exception as e:
+            print(f"Error: {str(e)}")
+            sys.exit(1)
+
+    def show_help(self, args: argparse.Namespace = None) -> None:
+        """Show help information."""
+        sys.stdout.write(_HELP_TEXT)
 
-        user = self.service.create_user(name, email, role)
+    # User Management Commands
+    def add_user(self, args: argparse.Namespace) -> None:
+        """Add a new user."""
+        user = self.service.create_user(args.name, args.email, args.role)
         print(f"User created successfully!")
         print(f"ID: {user.id}")
         print(f"Name: {user.name}")
         print(f"Email: {user.email}")
         print(f"Role: {user.role}")
 
-    def list_users(self, args: List[str]) -> None:
+    def list_users(self, args: argparse.Namespace) -> None:
         """List all users."""
         users = self.service.get_all_users()
         if not users:
             print("No users found.")
             return
 
-        print(f"\n{'ID':<40} {'Name':<20} {'Email':<30} {'Role':<15}")
-        print("-" * 105)
-        for user in users:
-            print(f"{user.id:<40} {user.name:<20} {user.email:<30} {user.role:<15}")
+        rows = [f"\n{'ID':<40} {'Name':<20} {'Email':<30} {'Role':<15}", "-" * 105]
+        rows.extend(
+            f"{user.id:<40} {user.name:<20} {user.email:<30} {user.role:<15}"
+            for user in users
+        )
+        sys.stdout.write("\n".join(rows) + "\n")
 
-    def update_user(self, args: List[str]) -> None:
+    def update_user(self, args: argparse.Namespace) -> None:
         """Update user information."""
-        if not args:
-            print(
-                "Usage: update-user <user_id> [--name <name>] [--email <email>] [--role <role>]"
-            )
-            return
-
-        user_id = args[0]
-        name = None
-        email = None
-        role = None
-
-        i = 1
-        while i < len(args):
-            if args[i] == "--name" and i + 1 < len(args):
-                name = args[i + 1]
-                i += 2
-            elif args[i] == "--email" and i + 1 < len(args):
-                email = args[i + 1]
-                i += 2
-            elif args[i] == "--role" and i + 1 < len(args):
-                role = args[i + 1]
-                i += 2
-            else:
-                i += 1
-
-        if self.service.update_user(user_id, name, email, role):
+        if self.service.update_user(args.user_id, args.name, args.email, args.role):
             print("User updated successfully!")
         else:
             print("User not found.")
 
-    def delete_user(self, args: List[str]) -> None:
+    def delete_user(self, args: argparse.Namespace) -> None:
         """Delete a user."""
-        if not args:
-            print("Usage: delete-user <user_id>")
-            return
-
-        user_id = args[0]
-        if self.service.delete_user(user_id):
+        if self.service.delete_user(args.user_id):
             print("User deleted successfully!")
         else:
             print("User not found.")
 
     # Task Management Commands
-    def add_task(self, args: List[str]) -> None:
+    def add_task(self, args: argparse.Namespace) -> None:
         """Add a new task."""
-        if not args:
-            print(
-                "Usage: add-task <title> [--desc <description>] [--priority <priority>] [--due <YYYY-MM-DD>]"
-            )
-            return
-
-        title = args[0]
-        description = ""
-        priority = Priority.MEDIUM
-        due_date = None
-
-        i = 1
-        while i < len(args):
-            if args[i] == "--desc" and i + 1 < len(args):
-                description = args[i + 1]
-                i += 2
-            elif args[i] == "--priority" and i + 1 < len(args):
-                try:
-                    priority = Priority(args[i + 1].title())
-                except ValueError:
-                    print("Invalid priority. Use: low, medium, high, urgent")
-                    return
-                i += 2
-            elif args[i] == "--due" and i + 1 < len(args):
-                try:
-                    due_date = datetime.strptime(args[i + 1], "%Y-%m-%d")
-                except ValueError:
-                    print("Invalid date format. Use: YYYY-MM-DD")
-                    return
-                i += 2
-            else:
-                i += 1
-
-        task = self.service.create_task(title, description, priority, due_date)
+        task = self.service.create_task(
+            args.title, args.desc, args.priority, args.due
+        )
         print(f"Task created successfully!")
         print(f"ID: {task.id}")
         print(f"Title: {task.title}")
         print(f"Status: {task.status.value}")
         print(f"Priority: {task.priority.value}")
 
-    def list_tasks(self, args: List[str]) -> None:
+    def list_tasks(self, args: argparse.Namespace) -> None:
         """List all tasks."""
         tasks = self.service.get_all_tasks()
         if not tasks:
             print("No tasks found.")
             return
 
-        print(
-            f"\n{'ID':<40} {'Title':<25} {'Status':<12} {'Priority':<10} {'Due Date':<12} {'Assignees':<15}"
-        )
-        print("-" * 125)
+        rows = [
+            f"\n{'ID':<40} {'Title':<25} {'Status':<12} {'Priority':<10} {'Due Date':<12} {'Assignees':<15}",
+            "-" * 125,
+        ]
         for task in tasks:
             due_date_str = (
                 task.due_date.strftime("%Y-%m-%d") if task.due_date else "None"
             )
             assignee_count = len(task.assignees)
             assignee_str = f"{assignee_count} user(s)"
-            print(
-                f"{task.id:<40} {task.title:<25} {task.status.value:<12} {task.priority.value:<10} {due_date_str:<12} {assignee_str:<15}"
+            rows.append(
+                " ".join(
+                    (
+                        task.id.ljust(40),
+                        task.title.ljust(25),
+                        _STATUS_STR[task.status].ljust(12),
+                        _PRIORITY_STR[task.priority].ljust(10),
+                        due_date_str.ljust(12),
+                        assignee_str.ljust(15),
+                    )
+                )
             )
+        sys.stdout.write("\n".join(rows) + "\n")
 
-    def update_task(self, args: List[str]) -> None:
+    def update_task(self, args: argparse.Namespace) -> None:
         """Update task information."""
-        if not args:
-            print(
-                "Usage: update-task <task_id> [--title <title>] [--desc <description>] [--status <status>] [--priority <priority>] [--due <YYYY-MM-DD>]"
-            )
-            return
-
-        task_id = args[0]
-        title = None
-        description = None
-        status = None
-        priority = None
-        due_date = None
-
-        i = 1
-        while i < len(args):
-            if args[i] == "--title" and i + 1 < len(args):
-                title = args[i + 1]
-                i += 2
-            elif args[i] == "--desc" and i + 1 < len(args):
-                description = args[i + 1]
-                i += 2
-            elif args[i] == "--status" and i + 1 < len(args):
-                status_map = {
-                    "todo": TaskStatus.TODO,
-                    "progress": TaskStatus.IN_PROGRESS,
-                    "done": TaskStatus.DONE,
-                }
-                status_key = args[i + 1].lower()
-                if status_key in status_map:
-                    status = status_map[status_key]
-                else:
-                    print("Invalid status. Use: todo, progress, done")
-                    return
-                i += 2
-            elif args[i] == "--priority" and i + 1 < len(args):
-                try:
-                    priority = Priority(args[i + 1].title())
-                except ValueError:
-                    print("Invalid priority. Use: low, medium, high, urgent")
-                    return
-                i += 2
-            elif args[i] == "--due" and i + 1 < len(args):
-                try:
-                    due_date = datetime.strptime(args[i + 1], "%Y-%m-%d")
-                except ValueError:
-                    print("Invalid date format. Use: YYYY-MM-DD")
-                    return
-                i += 2
-            else:
-                i += 1
-
         if self.service.update_task(
-            task_id, title, description, status, priority, due_date
+            args.task_id, args.title, args.desc, args.status, args.priority, args.due
         ):
             print("Task updated successfully!")
         else:
             print("Task not found.")
 
-    def delete_task(self, args: List[str]) -> None:
+    def delete_task(self, args: argparse.Namespace) -> None:
         """Delete a task."""
-        if not args:
-            print("Usage: delete-task <task_id>")
-            return
-
-        task_id = args[0]
-        if self.service.delete_task(task_id):
+        if self.service.delete_task(args.task_id):
             print("Task deleted successfully!")
         else:
             print("Task not found.")
 
     # Assignment Commands
-    def assign_task(self, args: List[str]) -> None:
+    def assign_task(self, args: argparse.Namespace) -> None:
         """Assign a task to a user."""
-        if len(args) < 2:
-            print("Usage: assign-task <task_id> <user_id>")
-            return
-
-        task_id, user_id = args[0], args[1]
-        if self.service.assign_task_to_user(task_id, user_id):
+        if self.service.assign_task_to_user(args.task_id, args.user_id):
             print("Task assigned successfully!")
         else:
             print("Task or user not found.")
 
-    def unassign_task(self, args: List[str]) -> None:
+    def unassign_task(self, args: argparse.Namespace) -> None:
         """Unassign a task from a user."""
-        if len(args) < 2:
-            print("Usage: unassign-task <task_id> <user_id>")
-            return
-
-        task_id, user_id = args[0], args[1]
-        if self.service.unassign_task_from_user(task_id, user_id):
+        if self.service.unassign_task_from_user(args.task_id, args.user_id):
             print("Task unassigned successfully!")
         else:
             print("Task not found.")
 
-    def reassign_task(self, args: List[str]) -> None:
+    def reassign_task(self, args: argparse.Namespace) -> None:
         """Reassign a task to new users."""
-        if len(args) < 2:
-            print("Usage: reassign-task <task_id> <user_id1,user_id2,...>")
-            return
-
-        task_id = args[0]
-        user_ids = args[1].split(",")
-
-        if self.service.reassign_task(task_id, user_ids):
+        if self.service.reassign_task(args.task_id, args.user_ids):
             print("Task reassigned successfully!")
         else:
             print("Task not found or invalid user IDs.")
 
     # View Commands
-    def view_tasks_by_user(self, args: List[str]) -> None:
+    def view_tasks_by_user(self, args: argparse.Namespace) -> None:
         """View tasks assigned to a specific user."""
-        if not args:
-            print("Usage: view-by-user <user_id>")
-            return
-
-        user_id = args[0]
-        user = self.service.get_user(user_id)
+        user = self.service.get_user(args.user_id)
         if not user:
             print("User not found.")
             return
 
-        tasks = self.service.get_tasks_by_user(user_id)
+        tasks = self.service.get_tasks_by_user(args.user_id)
         print(f"\nTasks assigned to {user.name} ({user.email}):")
         self._display_tasks(tasks)
 
-    def view_tasks_by_status(self, args: List[str]) -> None:
+    def view_tasks_by_status(self, args: argparse.Namespace) -> None:
         """View tasks by status."""
-        if not args:
-            print("Usage: view-by-status <status> (todo/progress/done)")
-            return
-
-        status_map = {
-            "todo": TaskStatus.TODO,
-            "progress": TaskStatus.IN_PROGRESS,
-            "done": TaskStatus.DONE,
-        }
-        status_key = args[0].lower()
-
-        if status_key not in status_map:
-            print("Invalid status. Use: todo, progress, done")
-            return
-
-        status = status_map[status_key]
-        tasks = self.service.get_tasks_by_status(status)
-        print(f"\nTasks with status '{status.value}':")
+        tasks = self.service.get_tasks_by_status(args.status)
+        print(f"\nTasks with status '{args.status.value}':")
         self._display_tasks(tasks)
 
-    def view_tasks_by_priority(self, args: List[str]) -> None:
+    def view_tasks_by_priority(self, args: argparse.Namespace) -> None:
         """View tasks by priority."""
-        if not args:
-            print("Usage: view-by-priority <priority> (low/medium/high/urgent)")
-            return
-
-        try:
-            priority = Priority(args[0].title())
-        except ValueError:
-            print("Invalid priority. Use: low, medium, high, urgent")
-            return
-
-        tasks = self.service.get_tasks_by_priority(priority)
-        print(f"\nTasks with priority '{priority.value}':")
+        tasks = self.service.get_tasks_by_priority(args.priority)
+        print(f"\nTasks with priority '{args.priority.value}':")
         self._display_tasks(tasks)
 
-    def view_overdue_tasks(self, args: List[str]) -> None:
+    def view_overdue_tasks(self, args: argparse.Namespace) -> None:
         """View overdue tasks."""
         tasks = self.service.get_overdue_tasks()
         print("\nOverdue tasks:")
         self._display_tasks(tasks)
 
     # Utility Commands
-    def search_tasks(self, args: List[str]) -> None:
+    def search_tasks(self, args: argparse.Namespace) -> None:
         """Search tasks by title or description."""
-        if not args:
+        if not args.query:
             print("Usage: search <query>")
             return
 
-        query = " ".join(args)
+        query = " ".join(args.query)
         tasks = self.service.search_tasks(query)
         print(f"\nSearch results for '{query}':")
         self._display_tasks(tasks)
 
-    def show_statistics(self, args: List[str]) -> None:
+    def show_statistics(self, args: argparse.Namespace) -> None:
         """Show task statistics."""
         stats = self.service.get_task_statistics()
         print("\nTask Statistics:")
@@ -439,18 +410,27 @@ EXAMPLES:
             print("No tasks found.")
             return
 
-        print(
-            f"\n{'ID':<40} {'Title':<25} {'Status':<12} {'Priority':<10} {'Due Date':<12}"
-        )
-        print("-" * 110)
+        rows = [
+            f"\n{'ID':<40} {'Title':<25} {'Status':<12} {'Priority':<10} {'Due Date':<12}",
+            "-" * 110,
+        ]
         for task in tasks:
             due_date_str = (
                 task.due_date.strftime("%Y-%m-%d") if task.due_date else "None"
             )
-            print(
-                f"{task.id:<40} {task.title:<25} {task.status.value:<12} {task.priority.value:<10} {due_date_str:<12}"
+            rows.append(
+                " ".join(
+                    (
+                        task.id.ljust(40),
+                        task.title.ljust(25),
+                        _STATUS_STR[task.status].ljust(12),
+                        _PRIORITY_STR[task.priority].ljust(10),
+                        due_date_str.ljust(12),
+                    )
+                )
             )
-        print(f"\nTotal: {len(tasks)} task(s)")
+        rows.append(f"\nTotal: {len(tasks)} task(s)")
+        sys.stdout.write("\n".join(rows) + "\n")
 
 
 def main():
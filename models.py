@@ -6,9 +6,23 @@ Contains data models for Task and User entities.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Optional, Set
 import uuid
 
+# Naive reference point for the cached due-date seconds; unlike
+# datetime.timestamp() this works for every representable date
+_EPOCH = datetime(1970, 1, 1)
+
+
+def seconds_since_epoch(when: datetime) -> float:
+    """Return a datetime as local wall-clock seconds since _EPOCH."""
+    delta = when.replace(tzinfo=None) - _EPOCH
+    offset = when.utcoffset()
+    if offset is not None:
+        # Shift aware datetimes from their own UTC offset to the local one
+        delta += datetime.now().astimezone().utcoffset() - offset
+    return delta.total_seconds()
+
 
 class TaskStatus(Enum):
     """Enumeration for task status values."""
@@ -27,7 +41,7 @@ class Priority(Enum):
     URGENT = "Urgent"
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class User:
     """User model with unique ID, name, email, and role."""
 
@@ -55,7 +69,7 @@ class User:
         }
 
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Task:
     """Task model with unique ID, title, description, status, due date, and priority."""
 
@@ -65,27 +79,42 @@ class Task:
     status: TaskStatus = TaskStatus.TODO
     due_date: Optional[datetime] = None
     priority: Priority = Priority.MEDIUM
-    assignees: List[str] = field(default_factory=list)  # List of user IDs
+    assignees: Set[str] = field(default_factory=set)  # Set of user IDs
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    # Lowercased copies of title/description used by search
+    _title_lower: str = field(init=False)
+    _desc_lower: str = field(init=False)
+    # due_date as seconds since _EPOCH, and the due_date it was computed from
+    _due_ts: Optional[float] = field(init=False)
+    _due_ts_source: Optional[datetime] = field(init=False)
 
     def __post_init__(self):
         """Validate task data after initialization."""
         if not self.title.strip():
             raise ValueError("Task title cannot be empty")
+        self._title_lower = self.title.lower()
+        self._desc_lower = self.description.lower()
+        self.set_due_date(self.due_date)
 
     def assign_user(self, user_id: str) -> None:
         """Assign a user to this task."""
         if user_id not in self.assignees:
-            self.assignees.append(user_id)
+            self.assignees.add(user_id)
             self.updated_at = datetime.now()
 
     def unassign_user(self, user_id: str) -> None:
         """Remove a user from this task."""
         if user_id in self.assignees:
-            self.assignees.remove(user_id)
+            self.assignees.discard(user_id)
             self.updated_at = datetime.now()
 
+    def set_due_date(self, due_date: Optional[datetime]) -> None:
+        """Set the due date along with its cached seconds value."""
+        self.due_date = due_date
+        self._due_ts = seconds_since_epoch(due_date) if due_date else None
+        self._due_ts_source = due_date
+
     def update_status(self, status: TaskStatus) -> None:
         """Update task status."""
         self.status = status
@@ -100,13 +129,20 @@ class Task:
             "status": self.status.value,
             "due_date": self.due_date.isoformat() if self.due_date else None,
             "priority": self.priority.value,
-            "assignees": self.assignees,
+            "assignees": sorted(self.assignees),
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
         }
 
     def is_overdue(self) -> bool:
         """Check if task is overdue."""
+        return self.is_overdue_at(seconds_since_epoch(datetime.now()))
+
+    def is_overdue_at(self, now: float) -> bool:
+        """Check if task is overdue at a time given by seconds_since_epoch()."""
         if self.due_date and self.status != TaskStatus.DONE:
-            return datetime.now() > self.due_date
+            if self.due_date is not self._due_ts_source:
+                # due_date was assigned directly; refresh the cached seconds
+                self.set_due_date(self.due_date)
+            return now > self._due_ts
         return False
@@ -4,8 +4,9 @@ Contains business logic and data management services.
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional
-from models import Task, User, TaskStatus, Priority
+import itertools
+from typing import Dict, List, Optional, ValuesView
+from models import Task, User, TaskStatus, Priority, seconds_since_epoch
 
 
 class TaskTrackerService:
@@ -15,6 +16,17 @@ class TaskTrackerService:
         """Initialize the service with empty data stores."""
         self.tasks: Dict[str, Task] = {}
         self.users: Dict[str, User] = {}
+        # Task ID -> creation sequence number, used to return index lookups
+        # in creation order
+        self._task_seq: Dict[str, int] = {}
+        self._next_seq = itertools.count()
+        # Reverse index: user ID -> IDs of tasks assigned to that user
+        self._user_tasks: Dict[str, Dict[str, None]] = {}
+        # Task IDs bucketed by status and by priority
+        self._by_status: Dict[TaskStatus, Dict[str, None]] = {
+            s: {} for s in TaskStatus
+        }
+        self._by_priority: Dict[Priority, Dict[str, None]] = {p: {} for p in Priority}
 
     # User Management Methods
     def create_user(self, name: str, email: str, role: str = "User") -> User:
@@ -27,9 +39,9 @@ class TaskTrackerService:
         """Get a user by ID."""
         return self.users.get(user_id)
 
-    def get_all_users(self) -> List[User]:
-        """Get all users."""
-        return list(self.users.values())
+    def get_all_users(self) -> ValuesView[User]:
+        """Get a live view of all users."""
+        return self.users.values()
 
     def update_user(
         self, user_id: str, name: str = None, email: str = None, role: str = None
@@ -54,8 +66,8 @@ class TaskTrackerService:
             return False
 
         # Remove user from all assigned tasks
-        for task in self.tasks.values():
-            task.unassign_user(user_id)
+        for task_id in self._user_tasks.pop(user_id, ()):
+            self.tasks[task_id].unassign_user(user_id)
 
         del self.users[user_id]
         return True
@@ -80,15 +92,18 @@ class TaskTrackerService:
             title=title, description=description, priority=priority, due_date=due_date
         )
         self.tasks[task.id] = task
+        self._task_seq[task.id] = next(self._next_seq)
+        self._by_status[task.status][task.id] = None
+        self._by_priority[task.priority][task.id] = None
         return task
 
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
         return self.tasks.get(task_id)
 
-    def get_all_tasks(self) -> List[Task]:
-        """Get all tasks."""
-        return list(self.tasks.values())
+    def get_all_tasks(self) -> ValuesView[Task]:
+        """Get a live view of all tasks."""
+        return self.tasks.values()
 
     def update_task(
         self,
@@ -106,23 +121,35 @@ class TaskTrackerService:
 
         if title is not None:
             task.title = title
+            task._title_lower = title.lower()
         if description is not None:
             task.description = description
-        if status is not None:
-            task.update_status(status)
-        if priority is not None:
+            task._desc_lower = description.lower()
+        if status is not None and status != task.status:
+            self._by_status[task.status].pop(task_id, None)
+            self._by_status[status][task_id] = None
+            task.status = status
+        if priority is not None and priority != task.priority:
+            self._by_priority[task.priority].pop(task_id, None)
+            self._by_priority[priority][task_id] = None
             task.priority = priority
         if due_date is not None:
-            task.due_date = due_date
+            task.set_due_date(due_date)
 
         task.updated_at = datetime.now()
         return True
 
     def delete_task(self, task_id: str) -> bool:
         """Delete a task."""
-        if task_id not in self.tasks:
+        task = self.tasks.pop(task_id, None)
+        if not task:
             return False
-        del self.tasks[task_id]
+
+        del self._task_seq[task_id]
+        self._by_status[task.status].pop(task_id, None)
+        self._by_priority[task.priority].pop(task_id, None)
+        for user_id in task.assignees:
+            self._user_tasks[user_id].pop(task_id, None)
         return True
 
     # Task Assignment Methods
@@ -135,6 +162,7 @@ class TaskTrackerService:
             return False
 
         task.assign_user(user_id)
+        self._user_tasks.setdefault(user_id, {})[task_id] = None
         return True
 
     def unassign_task_from_user(self, task_id: str, user_id: str) -> bool:
@@ -145,6 +173,8 @@ class TaskTrackerService:
             return False
 
         task.unassign_user(user_id)
+        if user_id in self._user_tasks:
+            self._user_tasks[user_id].pop(task_id, None)
         return True
 
     def reassign_task(self, task_id: str, new_user_ids: List[str]) -> bool:
@@ -154,26 +184,38 @@ class TaskTrackerService:
             return False
 
         # Validate all user IDs exist
-        for user_id in new_user_ids:
-            if user_id not in self.users:
-                return False
+        new_assignees = set(new_user_ids)
+        if new_assignees - self.users.keys():
+            return False
+
+        for user_id in task.assignees - new_assignees:
+            self._user_tasks[user_id].pop(task_id, None)
+        for user_id in new_assignees:
+            self._user_tasks.setdefault(user_id, {})[task_id] = None
 
-        task.assignees = new_user_ids.copy()
+        task.assignees = new_assignees
         task.updated_at = datetime.now()
         return True
 
     # Task Filtering Methods
+    def _tasks_in_creation_order(self, task_ids) -> List[Task]:
+        """Resolve task IDs to tasks, ordered by when they were created."""
+        return [
+            self.tasks[task_id]
+            for task_id in sorted(task_ids, key=self._task_seq.__getitem__)
+        ]
+
     def get_tasks_by_user(self, user_id: str) -> List[Task]:
         """Get all tasks assigned to a specific user."""
-        return [task for task in self.tasks.values() if user_id in task.assignees]
+        return self._tasks_in_creation_order(self._user_tasks.get(user_id, ()))
 
     def get_tasks_by_status(self, status: TaskStatus) -> List[Task]:
         """Get all tasks with a specific status."""
-        return [task for task in self.tasks.values() if task.status == status]
+        return self._tasks_in_creation_order(self._by_status[status])
 
     def get_tasks_by_priority(self, priority: Priority) -> List[Task]:
         """Get all tasks with a specific priority."""
-        return [task for task in self.tasks.values() if task.priority == priority]
+        return self._tasks_in_creation_order(self._by_priority[priority])
 
     def get_tasks_by_due_date(
         self, start_date: datetime = None, end_date: datetime = None
@@ -196,16 +238,20 @@ class TaskTrackerService:
 
     def get_overdue_tasks(self) -> List[Task]:
         """Get all overdue tasks."""
-        return [task for task in self.tasks.values() if task.is_overdue()]
+        now = seconds_since_epoch(datetime.now())
+        return [task for task in self.tasks.values() if task.is_overdue_at(now)]
 
     def get_task_statistics(self) -> Dict[str, int]:
         """Get task statistics."""
+        now = seconds_since_epoch(datetime.now())
         stats = {
             "total_tasks": len(self.tasks),
-            "todo_tasks": len(self.get_tasks_by_status(TaskStatus.TODO)),
-            "in_progress_tasks": len(self.get_tasks_by_status(TaskStatus.IN_PROGRESS)),
-            "done_tasks": len(self.get_tasks_by_status(TaskStatus.DONE)),
-            "overdue_tasks": len(self.get_overdue_tasks()),
+            "todo_tasks": len(self._by_status[TaskStatus.TODO]),
+            "in_progress_tasks": len(self._by_status[TaskStatus.IN_PROGRESS]),
+            "done_tasks": len(self._by_status[TaskStatus.DONE]),
+            "overdue_tasks": sum(
+                1 for task in self.tasks.values() if task.is_overdue_at(now)
+            ),
             "total_users": len(self.users),
         }
         return stats
@@ -216,7 +262,7 @@ class TaskTrackerService:
         results = []
 
         for task in self.tasks.values():
-            if query in task.title.lower() or query in task.description.lower():
+            if query in task._title_lower or query in task._desc_lower:
                 results.append(task)
 
         return results